@@ -22,7 +22,10 @@ from qiskit.aqua import QuantumInstance
 from qiskit.aqua.algorithms import (AmplitudeEstimation, MaximumLikelihoodAmplitudeEstimation,
                                     IterativeAmplitudeEstimation)
 
-from qiskit.quantum_info import Operator
+from qiskit.quantum_info import random_statevector
+
+_STATEVECTOR_BACKEND = BasicAer.get_backend('statevector_simulator')
+_QASM_BACKEND = BasicAer.get_backend('qasm_simulator')
 
 
 class BernoulliStateIn(QuantumCircuit):
@@ -41,14 +44,17 @@ class BernoulliGrover(QuantumCircuit):
         super().__init__(1)
         self.angle = 2 * np.arcsin(np.sqrt(probability))
         self.ry(2 * self.angle, 0)
+        self._powers = {}
 
     def power(self, power, matrix_power=False):
         if matrix_power:
             return super().power(power, True)
 
-        powered = QuantumCircuit(1)
-        powered.ry(power * 2 * self.angle, 0)
-        return powered
+        if power not in self._powers:
+            powered = QuantumCircuit(1)
+            powered.ry(power * 2 * self.angle, 0)
+            self._powers[power] = powered
+        return self._powers[power]
 
 
 class SineIntegral(QuantumCircuit):
@@ -69,8 +75,9 @@ class SineIntegral(QuantumCircuit):
 
         # apply the sine/cosine term
         self.ry(2 * 1 / 2 / 2 ** num_qubits, qr_objective[0])
-        for i, qubit in enumerate(qr_state):
-            self.cry(2 * 2**i / 2 ** num_qubits, qubit, qr_objective[0])
+        angles = 2 * 2.0 ** np.arange(num_qubits) / 2 ** num_qubits
+        for angle, qubit in zip(angles, qr_state):
+            self.cry(angle, qubit, qr_objective[0])
 
 
 @ddt
@@ -82,18 +89,29 @@ class TestBernoulli(QiskitAquaTestCase):
         * the constructed circuits
     """
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._statevector = QuantumInstance(backend=_STATEVECTOR_BACKEND,
+                                           seed_simulator=2, seed_transpiler=2)
+        cls._qasm_instances = {}
+
+    def _qasm(self, shots=100):
+        """Return the QASM quantum instance for ``shots``, shared across the tests."""
+        if shots not in self._qasm_instances:
+            self._qasm_instances[shots] = QuantumInstance(backend=_QASM_BACKEND, shots=shots,
+                                                          seed_simulator=2, seed_transpiler=2)
+        return self._qasm_instances[shots]
 
-        self._statevector = QuantumInstance(backend=BasicAer.get_backend('statevector_simulator'),
-                                            seed_simulator=2, seed_transpiler=2)
-        self._unitary = QuantumInstance(backend=BasicAer.get_backend('unitary_simulator'), shots=1,
-                                        seed_simulator=42, seed_transpiler=91)
+    def _assert_circuits_equivalent(self, circuit, other, num_states=3):
+        """Assert two circuits act equally on a few seeded random states.
 
-        def qasm(shots=100):
-            return QuantumInstance(backend=BasicAer.get_backend('qasm_simulator'), shots=shots,
-                                   seed_simulator=2, seed_transpiler=2)
-        self._qasm = qasm
+        This is much cheaper than comparing the full dense unitaries via ``Operator``.
+        """
+        self.assertEqual(circuit.num_qubits, other.num_qubits)
+        for seed in range(num_states):
+            state = random_statevector(2 ** circuit.num_qubits, seed=seed)
+            self.assertEqual(state.evolve(circuit), state.evolve(other))
 
     @idata([
         [0.2, AmplitudeEstimation(2), {'estimation': 0.5, 'mle': 0.2}],
@@ -110,9 +128,9 @@ class TestBernoulli(QiskitAquaTestCase):
         qae.state_preparation = BernoulliStateIn(prob)
         qae.grover_operator = BernoulliGrover(prob)
 
+        self._statevector.reset_execution_results()
         result = qae.run(self._statevector)
         self.assertGreater(self._statevector.time_taken, 0.)
-        self._statevector.reset_execution_results()
         for key, value in expect.items():
             self.assertAlmostEqual(value, getattr(result, key), places=3,
                                    msg="estimate `{}` failed".format(key))
@@ -142,10 +160,22 @@ class TestBernoulli(QiskitAquaTestCase):
         Build the circuit manually and from the algorithm and compare the resulting unitaries.
         """
         prob = 0.5
+        angle = 2 * np.arcsin(np.sqrt(prob))
+        evaluation_qubits = [2, 5]
+
+        oracle = QuantumCircuit(1)
+        oracle.z(0)
 
-        for m in [2, 5]:
+        state_preparation = QuantumCircuit(1)
+        state_preparation.ry(angle, 0)
+        grover_op = GroverOperator(oracle, state_preparation)
+
+        # the controlled powers only depend on the exponent, share them across all m
+        controlled_powers = [grover_op.power(2 ** power).control()
+                             for power in range(max(evaluation_qubits))]
+
+        for m in evaluation_qubits:
             qae = AmplitudeEstimation(m, BernoulliStateIn(prob))
-            angle = 2 * np.arcsin(np.sqrt(prob))
 
             # manually set up the inefficient AE circuit
             qr_eval = QuantumRegister(m, 'a')
@@ -161,17 +191,12 @@ class TestBernoulli(QiskitAquaTestCase):
 
             if efficient_circuit:
                 qae.grover_operator = BernoulliGrover(prob)
+                rotation_angles = 2 * 2.0 ** np.arange(m) * angle
                 for power in range(m):
-                    circuit.cry(2 * 2 ** power * angle, qr_eval[power], qr_objective[0])
+                    circuit.cry(rotation_angles[power], qr_eval[power], qr_objective[0])
             else:
-                oracle = QuantumCircuit(1)
-                oracle.z(0)
-
-                state_preparation = QuantumCircuit(1)
-                state_preparation.ry(angle, 0)
-                grover_op = GroverOperator(oracle, state_preparation)
                 for power in range(m):
-                    circuit.compose(grover_op.power(2 ** power).control(),
+                    circuit.compose(controlled_powers[power],
                                     qubits=[qr_eval[power], qr_objective[0]],
                                     inplace=True)
 
@@ -181,7 +206,7 @@ class TestBernoulli(QiskitAquaTestCase):
 
             actual_circuit = qae.construct_circuit(measurement=False)
 
-            self.assertEqual(Operator(circuit), Operator(actual_circuit))
+            self._assert_circuits_equivalent(circuit, actual_circuit)
 
     @data(True, False)
     def test_iqae_circuits(self, efficient_circuit):
@@ -212,11 +237,10 @@ class TestBernoulli(QiskitAquaTestCase):
                 state_preparation = QuantumCircuit(1)
                 state_preparation.ry(angle, 0)
                 grover_op = GroverOperator(oracle, state_preparation)
-                for _ in range(k):
-                    circuit.compose(grover_op, inplace=True)
+                circuit.compose(grover_op.power(k), inplace=True)
 
             actual_circuit = qae.construct_circuit(k, measurement=False)
-            self.assertEqual(Operator(circuit), Operator(actual_circuit))
+            self._assert_circuits_equivalent(circuit, actual_circuit)
 
     @data(True, False)
     def test_mlae_circuits(self, efficient_circuit):
@@ -237,6 +261,7 @@ class TestBernoulli(QiskitAquaTestCase):
             circuits += [circuit]
 
             # powers of 2
+            rotation_angles = 2 * 2.0 ** np.arange(k) * angle
             for power in range(k):
                 q_objective = QuantumRegister(1, 'q')
                 circuit = QuantumCircuit(q_objective)
@@ -247,23 +272,23 @@ class TestBernoulli(QiskitAquaTestCase):
                 # Q^(2^j) operator
                 if efficient_circuit:
                     qae.grover_operator = BernoulliGrover(prob)
-                    circuit.ry(2 * 2 ** power * angle, q_objective[0])
+                    circuit.ry(rotation_angles[power], q_objective[0])
 
                 else:
                     oracle = QuantumCircuit(1)
-                    oracle.x(0)
                     oracle.z(0)
-                    oracle.x(0)
                     state_preparation = QuantumCircuit(1)
                     state_preparation.ry(angle, 0)
                     grover_op = GroverOperator(oracle, state_preparation)
-                    for _ in range(2**power):
-                        circuit.compose(grover_op, inplace=True)
+                    circuit.compose(grover_op.power(2 ** power), inplace=True)
+
+                circuits += [circuit]
 
             actual_circuits = qae.construct_circuits(measurement=False)
 
+            self.assertEqual(len(actual_circuits), len(circuits))
             for actual, expected in zip(actual_circuits, circuits):
-                self.assertEqual(Operator(actual), Operator(expected))
+                self._assert_circuits_equivalent(actual, expected)
 
 
 @ddt
@@ -333,18 +358,21 @@ class TestSineIntegral(QiskitAquaTestCase):
         * the confidence intervals
     """
 
-    def setUp(self):
-        super().setUp()
-
-        self._statevector = QuantumInstance(backend=BasicAer.get_backend('statevector_simulator'),
-                                            seed_simulator=123,
-                                            seed_transpiler=41)
-
-        def qasm(shots=100):
-            return QuantumInstance(backend=BasicAer.get_backend('qasm_simulator'), shots=shots,
-                                   seed_simulator=7192, seed_transpiler=90000)
-
-        self._qasm = qasm
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._statevector = QuantumInstance(backend=_STATEVECTOR_BACKEND,
+                                           seed_simulator=123,
+                                           seed_transpiler=41)
+        cls._qasm_instances = {}
+
+    def _qasm(self, shots=100):
+        """Return the QASM quantum instance for ``shots``, shared across the tests."""
+        if shots not in self._qasm_instances:
+            self._qasm_instances[shots] = QuantumInstance(backend=_QASM_BACKEND, shots=shots,
+                                                          seed_simulator=7192,
+                                                          seed_transpiler=90000)
+        return self._qasm_instances[shots]
 
     @idata([
         [2, AmplitudeEstimation(2), {'estimation': 0.5, 'mle': 0.270290}],
@@ -357,9 +385,9 @@ class TestSineIntegral(QiskitAquaTestCase):
         # construct factories for A and Q
         qae.state_preparation = SineIntegral(n)
 
+        self._statevector.reset_execution_results()
         result = qae.run(self._statevector)
         self.assertGreater(self._statevector.time_taken, 0.)
-        self._statevector.reset_execution_results()
         for key, value in expect.items():
             self.assertAlmostEqual(value, getattr(result, key), places=3,
                                    msg="estimate `{}` failed".format(key))
@@ -398,9 +426,9 @@ class TestSineIntegral(QiskitAquaTestCase):
         qae.state_preparation = SineIntegral(n)
 
         # statevector simulator
+        self._statevector.reset_execution_results()
         result = qae.run(self._statevector)
         self.assertGreater(self._statevector.time_taken, 0.)
-        self._statevector.reset_execution_results()
         methods = ['lr', 'fi', 'oi']  # short for likelihood_ratio, fisher, observed_fisher
         alphas = [0.1, 0.00001, 0.9]  # alpha shouldn't matter in statevector
         for alpha, method in zip(alphas, methods):
@@ -425,9 +453,9 @@ class TestSineIntegral(QiskitAquaTestCase):
         expected_confint = [0.19840508760087738, 0.35110155403424115]
 
         # statevector simulator
+        self._statevector.reset_execution_results()
         result = qae.run(self._statevector)
         self.assertGreater(self._statevector.time_taken, 0.)
-        self._statevector.reset_execution_results()
         confint = result.confidence_interval
         # confidence interval based on statevector should be empty, as we are sure of the result
         self.assertAlmostEqual(confint[1] - confint[0], 0.0)
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2018, 2020.
+# (C) Copyright IBM 2018, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,7 +12,18 @@
 
 """Chemistry Test Case"""
 
+import copy
+import functools
 from test import QiskitBaseTestCase
+from qiskit.chemistry import QMolecule
+from qiskit.chemistry.drivers import PySCFDriver, UnitsType
+
+
+@functools.lru_cache(maxsize=None)
+def _run_pyscf_driver(atom: str, unit: UnitsType, charge: int, spin: int,
+                      basis: str) -> QMolecule:
+    driver = PySCFDriver(atom=atom, unit=unit, charge=charge, spin=spin, basis=basis)
+    return driver.run()
 
 
 class QiskitChemistryTestCase(QiskitBaseTestCase):
@@ -21,3 +32,26 @@ class QiskitChemistryTestCase(QiskitBaseTestCase):
     def setUp(self) -> None:
         super().setUp()
         self._class_location = __file__
+
+    @staticmethod
+    def run_pyscf_driver(atom: str,
+                         unit: UnitsType = UnitsType.ANGSTROM,
+                         charge: int = 0,
+                         spin: int = 0,
+                         basis: str = 'sto3g') -> QMolecule:
+        """Run the PySCF driver for the given molecule, computing its SCF only once per process.
+
+        Args:
+            atom: atom list or string separated by semicolons or line breaks
+            unit: angstrom or bohr
+            charge: charge
+            spin: spin
+            basis: basis set
+
+        Returns:
+            A copy of the cached molecule, so tests are free to modify it.
+
+        Raises:
+            QiskitChemistryError: PySCF is not installed.
+        """
+        return copy.deepcopy(_run_pyscf_driver(atom, unit, charge, spin, basis))
@@ -151,9 +151,13 @@ class TestAdaptVQE(QiskitChemistryTestCase):
             ([1, 2, 3, 4, 1, 2, 3, 41], False),
             ([1, 2, 3, 4, 5, 1, 2, 3, 4], False),
         ]
-        for seq, is_cycle in param_list:
-            with self.subTest(msg="Checking index cyclicity in:", seq=seq):
-                self.assertEqual(is_cycle, AdaptVQE._check_cyclicity(seq))
+        expected = [is_cycle for _, is_cycle in param_list]
+        actual = [AdaptVQE._check_cyclicity(seq) for seq, _ in param_list]
+        if actual != expected:
+            # only break the comparison down into sub tests to report which sequences failed
+            for (seq, is_cycle), result in zip(param_list, actual):
+                with self.subTest(msg="Checking index cyclicity in:", seq=seq):
+                    self.assertEqual(is_cycle, result)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2018, 2020.
+# (C) Copyright IBM 2018, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -25,14 +25,13 @@ class TestDriverPySCF(QiskitChemistryTestCase, TestDriver):
     def setUp(self):
         super().setUp()
         try:
-            driver = PySCFDriver(atom='H .0 .0 .0; H .0 .0 0.735',
-                                 unit=UnitsType.ANGSTROM,
-                                 charge=0,
-                                 spin=0,
-                                 basis='sto3g')
+            self.qmolecule = self.run_pyscf_driver(atom='H .0 .0 .0; H .0 .0 0.735',
+                                                   unit=UnitsType.ANGSTROM,
+                                                   charge=0,
+                                                   spin=0,
+                                                   basis='sto3g')
         except QiskitChemistryError:
             self.skipTest('PYSCF driver does not appear to be installed')
-        self.qmolecule = driver.run()
 
 
 class TestDriverPySCFMolecule(QiskitChemistryTestCase, TestDriver):
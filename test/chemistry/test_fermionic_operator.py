@@ -12,45 +12,37 @@
 
 """ Test Fermionic Operator """
 
-import copy
 import unittest
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
+from qiskit.aqua import aqua_globals
 from qiskit.aqua.utils import random_unitary
 from qiskit.aqua.operators.legacy import op_converter
 from qiskit.chemistry import FermionicOperator, QiskitChemistryError
-from qiskit.chemistry.drivers import PySCFDriver, UnitsType
+from qiskit.chemistry.drivers import UnitsType
 
 
 def h2_transform_slow(h2_, unitary_matrix):
     """
     Transform h2 based on unitary matrix, and overwrite original property.
-    #MARK: A naive implementation based on MATLAB implementation.
+    #MARK: A reference implementation contracting one index at a time with tensordot.
     Args:
         unitary_matrix (numpy 2-D array, float or complex):
                     Unitary matrix for h2 transformation.
     Returns:
         temp_ret: matrix
     """
-    num_modes = unitary_matrix.shape[0]
-    temp1 = np.zeros((num_modes, num_modes, num_modes, num_modes), dtype=unitary_matrix.dtype)
-    temp2 = np.zeros((num_modes, num_modes, num_modes, num_modes), dtype=unitary_matrix.dtype)
-    temp3 = np.zeros((num_modes, num_modes, num_modes, num_modes), dtype=unitary_matrix.dtype)
-    temp_ret = np.zeros((num_modes, num_modes, num_modes, num_modes), dtype=unitary_matrix.dtype)
-    unitary_matrix_dagger = np.conjugate(unitary_matrix)
-    # pylint: disable=unsubscriptable-object
-    for a_i in range(num_modes):
-        for i in range(num_modes):
-            temp1[a_i, :, :, :] += unitary_matrix_dagger[i, a_i] * h2_[i, :, :, :]
-        for b in range(num_modes):
-            for j in range(num_modes):
-                temp2[a_i, b, :, :] += unitary_matrix[j, b] * temp1[a_i, j, :, :]
-            for c in range(num_modes):
-                for k in range(num_modes):
-                    temp3[a_i, b, c, :] += unitary_matrix_dagger[k, c] * temp2[a_i, b, k, :]
-                for d_i in range(num_modes):
-                    for l_i in range(num_modes):
-                        temp_ret[a_i, b, c, d_i] += unitary_matrix[l_i, d_i] * temp3[a_i, b, c, l_i]
+    # real orbitals need no conjugation, and keep every contraction in float64
+    if np.isrealobj(unitary_matrix):
+        unitary_matrix_dagger = unitary_matrix
+    else:
+        unitary_matrix_dagger = np.conjugate(unitary_matrix)
+    # each contraction consumes the leading index and appends the transformed one at the end,
+    # so after all four the indices are back in their original order
+    temp_ret = np.tensordot(h2_, unitary_matrix_dagger, axes=([0], [0]))
+    temp_ret = np.tensordot(temp_ret, unitary_matrix, axes=([0], [0]))
+    temp_ret = np.tensordot(temp_ret, unitary_matrix_dagger, axes=([0], [0]))
+    temp_ret = np.tensordot(temp_ret, unitary_matrix, axes=([0], [0]))
     return temp_ret
 
 
@@ -60,24 +52,20 @@ class TestFermionicOperator(QiskitChemistryTestCase):
     def setUp(self):
         super().setUp()
         try:
-            driver = PySCFDriver(atom='Li .0 .0 .0; H .0 .0 1.595',
-                                 unit=UnitsType.ANGSTROM,
-                                 charge=0,
-                                 spin=0,
-                                 basis='sto3g')
+            molecule = self.run_pyscf_driver(atom='Li .0 .0 .0; H .0 .0 1.595',
+                                             unit=UnitsType.ANGSTROM,
+                                             charge=0,
+                                             spin=0,
+                                             basis='sto3g')
         except QiskitChemistryError:
             self.skipTest('PYSCF driver does not appear to be installed')
 
-        molecule = driver.run()
         self.fer_op = FermionicOperator(h1=molecule.one_body_integrals,
                                         h2=molecule.two_body_integrals)
 
-    def test_transform(self):
-        """ transform test """
-        unitary_matrix = random_unitary(self.fer_op.h1.shape[0])
-
-        reference_fer_op = copy.deepcopy(self.fer_op)
-        target_fer_op = copy.deepcopy(self.fer_op)
+    def _check_transform(self, unitary_matrix):
+        reference_fer_op = FermionicOperator(h1=self.fer_op.h1.copy(), h2=self.fer_op.h2.copy())
+        target_fer_op = FermionicOperator(h1=self.fer_op.h1.copy(), h2=self.fer_op.h2.copy())
 
         reference_fer_op._h1_transform(unitary_matrix)
         reference_fer_op.h2 = h2_transform_slow(reference_fer_op.h2, unitary_matrix)
@@ -85,20 +73,36 @@ class TestFermionicOperator(QiskitChemistryTestCase):
         target_fer_op._h1_transform(unitary_matrix)
         target_fer_op._h2_transform(unitary_matrix)
 
-        h1_nonzeros = np.count_nonzero(reference_fer_op.h1 - target_fer_op.h1)
-        self.assertEqual(h1_nonzeros, 0, "there are differences between h1 transformation")
+        self.assertTrue(np.array_equal(reference_fer_op.h1, target_fer_op.h1),
+                        "there are differences between h1 transformation")
+
+        # the contraction order differs from _h2_transform, so allow for rounding differences
+        np.testing.assert_allclose(reference_fer_op.h2, target_fer_op.h2, rtol=0, atol=1e-12,
+                                   err_msg="there are differences between h2 transformation")
+        return reference_fer_op
+
+    def test_transform(self):
+        """ transform test """
+        aqua_globals.random_seed = 50
+        unitary_matrix = random_unitary(self.fer_op.h1.shape[0])
+        self._check_transform(unitary_matrix)
 
-        h2_nonzeros = np.count_nonzero(reference_fer_op.h2 - target_fer_op.h2)
-        self.assertEqual(h2_nonzeros, 0, "there are differences between h2 transformation")
+    def test_transform_real(self):
+        """ transform test with a real orthogonal matrix """
+        aqua_globals.random_seed = 50
+        num_modes = self.fer_op.h1.shape[0]
+        orthogonal_matrix, _ = np.linalg.qr(aqua_globals.random.random((num_modes, num_modes)))
+        reference_fer_op = self._check_transform(orthogonal_matrix)
+        # real integrals and orbitals keep the reference transformation real
+        self.assertTrue(np.isrealobj(reference_fer_op.h2))
 
     def test_freezing_core(self):
         """ freezing core test """
-        driver = PySCFDriver(atom='H .0 .0 -1.160518; Li .0 .0 0.386839',
-                             unit=UnitsType.ANGSTROM,
-                             charge=0,
-                             spin=0,
-                             basis='sto3g')
-        molecule = driver.run()
+        molecule = self.run_pyscf_driver(atom='H .0 .0 -1.160518; Li .0 .0 0.386839',
+                                         unit=UnitsType.ANGSTROM,
+                                         charge=0,
+                                         spin=0,
+                                         basis='sto3g')
         fer_op = FermionicOperator(h1=molecule.one_body_integrals,
                                    h2=molecule.two_body_integrals)
         fer_op, energy_shift = fer_op.fermion_mode_freezing([0, 6])
@@ -106,12 +110,11 @@ class TestFermionicOperator(QiskitChemistryTestCase):
         diff = abs(energy_shift - g_t)
         self.assertLess(diff, 1e-6)
 
-        driver = PySCFDriver(atom='H .0 .0 .0; Na .0 .0 1.888',
-                             unit=UnitsType.ANGSTROM,
-                             charge=0,
-                             spin=0,
-                             basis='sto3g')
-        molecule = driver.run()
+        molecule = self.run_pyscf_driver(atom='H .0 .0 .0; Na .0 .0 1.888',
+                                         unit=UnitsType.ANGSTROM,
+                                         charge=0,
+                                         spin=0,
+                                         basis='sto3g')
         fer_op = FermionicOperator(h1=molecule.one_body_integrals,
                                    h2=molecule.two_body_integrals)
         fer_op, energy_shift = fer_op.fermion_mode_freezing([0, 1, 2, 3, 4, 10, 11, 12, 13, 14])
@@ -124,12 +127,11 @@ class TestFermionicOperator(QiskitChemistryTestCase):
 
         The spectrum of bksf mapping should be half of jordan wigner mapping.
         """
-        driver = PySCFDriver(atom='H .0 .0 0.7414; H .0 .0 .0',
-                             unit=UnitsType.ANGSTROM,
-                             charge=0,
-                             spin=0,
-                             basis='sto3g')
-        molecule = driver.run()
+        molecule = self.run_pyscf_driver(atom='H .0 .0 0.7414; H .0 .0 .0',
+                                         unit=UnitsType.ANGSTROM,
+                                         charge=0,
+                                         spin=0,
+                                         basis='sto3g')
         fer_op = FermionicOperator(h1=molecule.one_body_integrals,
                                    h2=molecule.two_body_integrals)
         jw_op = fer_op.mapping('jordan_wigner')
@@ -137,12 +139,13 @@ class TestFermionicOperator(QiskitChemistryTestCase):
 
         jw_op = op_converter.to_matrix_operator(jw_op)
         bksf_op = op_converter.to_matrix_operator(bksf_op)
-        jw_eigs = np.linalg.eigvals(jw_op.matrix.toarray())
-        bksf_eigs = np.linalg.eigvals(bksf_op.matrix.toarray())
+        # both operators are Hermitian, eigvalsh returns their real spectra in ascending order
+        jw_eigs = np.around(np.linalg.eigvalsh(jw_op.matrix.toarray()), 6)
+        bksf_eigs = np.around(np.linalg.eigvalsh(bksf_op.matrix.toarray()), 6)
 
-        jw_eigs = np.sort(np.around(jw_eigs.real, 6))
-        bksf_eigs = np.sort(np.around(bksf_eigs.real, 6))
-        overlapped_spectrum = np.sum(np.isin(jw_eigs, bksf_eigs))
+        # count the jw eigenvalues that appear in the (sorted) bksf spectrum
+        indices = np.minimum(np.searchsorted(bksf_eigs, jw_eigs), bksf_eigs.size - 1)
+        overlapped_spectrum = np.sum(bksf_eigs[indices] == jw_eigs)
 
         self.assertEqual(overlapped_spectrum, jw_eigs.size // 2)
 
@@ -33,6 +33,9 @@ from qiskit.chemistry.algorithms.ground_state_solvers.minimum_eigensolver_factor
 class TestGroundStateEigensolver(QiskitChemistryTestCase):
     """ Test GroundStateEigensolver """
 
+    # ground state calculation shared by the evaluation tests, see _setup_evaluation_operators
+    _evaluation_operators = None
+
     def setUp(self):
         super().setUp()
         try:
@@ -86,15 +89,19 @@ class TestGroundStateEigensolver(QiskitChemistryTestCase):
         assert all(a == b for a, b in zip(aux_ops, aux_ops_copy))
 
     def _setup_evaluation_operators(self):
-        # first we run a ground state calculation
-        solver = VQEUCCSDFactory(QuantumInstance(BasicAer.get_backend('statevector_simulator')))
-        calc = GroundStateEigensolver(self.transformation, solver)
-        res = calc.solve(self.driver)
-
-        # now we decide that we want to evaluate another operator
-        # for testing simplicity, we just use some pre-constructed auxiliary operators
-        _, aux_ops = self.transformation.transform(self.driver)
-        return calc, res, aux_ops
+        # the evaluation tests only read the result, so the VQE run is done once per class
+        if TestGroundStateEigensolver._evaluation_operators is None:
+            # first we run a ground state calculation
+            solver = VQEUCCSDFactory(
+                QuantumInstance(BasicAer.get_backend('statevector_simulator')))
+            calc = GroundStateEigensolver(self.transformation, solver)
+            res = calc.solve(self.driver)
+
+            # now we decide that we want to evaluate another operator
+            # for testing simplicity, we just use some pre-constructed auxiliary operators
+            _, aux_ops = self.transformation.transform(self.driver)
+            TestGroundStateEigensolver._evaluation_operators = (calc, res, aux_ops)
+        return TestGroundStateEigensolver._evaluation_operators
 
     def test_eval_op_single(self):
         """ Test evaluating a single additional operator """
@@ -24,7 +24,7 @@ from qiskit.chemistry import FermionicOperator
 from qiskit.chemistry.algorithms import VQEAdapt
 from qiskit.chemistry.circuit.library import HartreeFock
 from qiskit.chemistry.components.variational_forms import UCCSD
-from qiskit.chemistry.drivers import PySCFDriver, UnitsType
+from qiskit.chemistry.drivers import UnitsType
 from qiskit.chemistry import QiskitChemistryError
 
 
@@ -37,14 +37,13 @@ class TestVQEAdaptUCCSD(QiskitChemistryTestCase):
         self.seed = 50
         aqua_globals.random_seed = self.seed
         try:
-            driver = PySCFDriver(atom='H .0 .0 .0; H .0 .0 0.735',
-                                 unit=UnitsType.ANGSTROM,
-                                 basis='sto3g')
+            molecule = self.run_pyscf_driver(atom='H .0 .0 .0; H .0 .0 0.735',
+                                             unit=UnitsType.ANGSTROM,
+                                             basis='sto3g')
         except QiskitChemistryError:
             self.skipTest('PYSCF driver does not appear to be installed')
             return
 
-        molecule = driver.run()
         self.num_particles = molecule.num_alpha + molecule.num_beta
         self.num_spin_orbitals = molecule.num_orbitals * 2
         fer_op = FermionicOperator(h1=molecule.one_body_integrals, h2=molecule.two_body_integrals)
@@ -80,18 +79,18 @@ class TestVQEAdaptUCCSD(QiskitChemistryTestCase):
                                    self.num_particles, initial_state=self.init_state)
         optimizer = L_BFGS_B()
 
-        warnings.filterwarnings('ignore', category=DeprecationWarning)
-        algorithm = VQEAdapt(self.qubit_op, self.var_form_base, optimizer,
-                             threshold=0.00001, delta=0.1, max_iterations=1)
-        warnings.filterwarnings('always', category=DeprecationWarning)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            algorithm = VQEAdapt(self.qubit_op, self.var_form_base, optimizer,
+                                 threshold=0.00001, delta=0.1, max_iterations=1)
         result = algorithm.run(backend)
         self.assertEqual(result.num_iterations, 1)
         self.assertEqual(result.finishing_criterion, 'Maximum number of iterations reached')
 
-        warnings.filterwarnings('ignore', category=DeprecationWarning)
-        algorithm = VQEAdapt(self.qubit_op, self.var_form_base, optimizer,
-                             threshold=0.00001, delta=0.1)
-        warnings.filterwarnings('always', category=DeprecationWarning)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            algorithm = VQEAdapt(self.qubit_op, self.var_form_base, optimizer,
+                                 threshold=0.00001, delta=0.1)
         result = algorithm.run(backend)
         self.assertAlmostEqual(result.eigenvalue.real, -1.85727503, places=2)
         self.assertEqual(result.num_iterations, 2)
@@ -127,9 +126,13 @@ class TestVQEAdaptUCCSD(QiskitChemistryTestCase):
             ([1, 2, 3, 4, 1, 2, 3, 41], False),
             ([1, 2, 3, 4, 5, 1, 2, 3, 4], False),
         ]
-        for seq, is_cycle in param_list:
-            with self.subTest(msg="Checking index cyclicity in:", seq=seq):
-                self.assertEqual(is_cycle, VQEAdapt._check_cyclicity(seq))
+        expected = [is_cycle for _, is_cycle in param_list]
+        actual = [VQEAdapt._check_cyclicity(seq) for seq, _ in param_list]
+        if actual != expected:
+            # only break the comparison down into sub tests to report which sequences failed
+            for (seq, is_cycle), result in zip(param_list, actual):
+                with self.subTest(msg="Checking index cyclicity in:", seq=seq):
+                    self.assertEqual(is_cycle, result)
 
 
 if __name__ == '__main__':
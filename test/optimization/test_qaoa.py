@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2018, 2020.
+# (C) Copyright IBM 2018, 2021.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -12,16 +12,16 @@
 
 """ Test QAOA """
 
+import functools
 import unittest
 from test.optimization import QiskitOptimizationTestCase
 
-import math
-import networkx as nx
 import numpy as np
 from ddt import ddt, idata, unpack
-from qiskit import BasicAer, QuantumCircuit, execute
+from qiskit import BasicAer, QuantumCircuit
 
 from qiskit.circuit import Parameter
+from qiskit.quantum_info import Statevector
 from qiskit.optimization.applications.ising import max_cut
 from qiskit.optimization.applications.ising.common import sample_most_likely
 from qiskit.aqua.components.optimizers import COBYLA, NELDER_MEAD
@@ -35,10 +35,11 @@ W1 = np.array([
     [1, 0, 1, 0],
     [0, 1, 0, 1],
     [1, 0, 1, 0]
-])
+], dtype=float)
+W1.setflags(write=False)
 P1 = 1
 M1 = (I ^ I ^ I ^ X) + (I ^ I ^ X ^ I) + (I ^ X ^ I ^ I) + (X ^ I ^ I ^ I)
-S1 = {'0101', '1010'}
+S1 = frozenset({'0101', '1010'})
 
 
 W2 = np.array([
@@ -46,39 +47,107 @@ W2 = np.array([
     [8., 0., 7., 9.],
     [-9., 7., 0., -8.],
     [0., 9., -8., 0.],
-])
+], dtype=float)
+W2.setflags(write=False)
 P2 = 1
 M2 = None
-S2 = {'1011', '0100'}
+S2 = frozenset({'1011', '0100'})
 
-CUSTOM_SUPERPOSITION = [1/math.sqrt(15)] * 15 + [0]
+W3 = np.array([
+    [0, 1, 0, 1, 0, 1],
+    [1, 0, 1, 0, 1, 0],
+    [0, 1, 0, 1, 0, 1],
+    [1, 0, 1, 0, 1, 0],
+    [0, 1, 0, 1, 0, 1],
+    [1, 0, 1, 0, 1, 0],
+], dtype=float)
+W3.setflags(write=False)
+S3 = frozenset({'010101', '101010'})
+
+# adjacency matrix of nx.fast_gnp_random_graph(5, 0.5, seed=10598)
+W4 = np.array([
+    [0, 0, 1, 0, 0],
+    [0, 0, 0, 1, 1],
+    [1, 0, 0, 1, 0],
+    [0, 1, 1, 0, 0],
+    [0, 1, 0, 0, 0],
+], dtype=float)
+W4.setflags(write=False)
+
+CUSTOM_SUPERPOSITION = np.append(np.full(15, 1 / np.sqrt(15)), 0.)
+CUSTOM_SUPERPOSITION.setflags(write=False)
+
+_GRAPHS = {'W1': W1, 'W2': W2, 'W3': W3}
+
+
+@functools.lru_cache(maxsize=None)
+def _opflow_max_cut_operator(graph):
+    qubit_op, offset = max_cut.get_operator(_GRAPHS[graph])
+    return qubit_op.to_opflow(), offset
+
+
+@functools.lru_cache(maxsize=None)
+def _matrix_max_cut_operator(graph):
+    qubit_op, offset = _opflow_max_cut_operator(graph)
+    return qubit_op.to_matrix_op(), offset
+
+
+def _max_cut_operator(graph, convert_to_matrix_op=False):
+    """ Opflow max_cut operator and offset of the module graph named ``graph``. """
+    if convert_to_matrix_op:
+        return _matrix_max_cut_operator(graph)
+    return _opflow_max_cut_operator(graph)
+
+
+def _bitstring(x):
+    """ Bitstring of a 0/1 solution vector, e.g. [0, 1, 0, 1] -> '0101'. """
+    return (np.asarray(x, dtype=np.uint8) + ord('0')).tobytes().decode('ascii')
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_quantum_instance(seed):
+    return QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                           seed_simulator=seed, seed_transpiler=seed)
+
+
+def _quantum_instance(seed=None):
+    """ Statevector quantum instance shared by all tests using the same seed. """
+    quantum_instance = _cached_quantum_instance(seed)
+    quantum_instance.reset_execution_results()
+    return quantum_instance
+
+
+@functools.lru_cache(maxsize=None)
+def _uniform_superposition(num_qubits):
+    """ Statevector of QAOA's default initial state, a Hadamard on every qubit. """
+    # evolved rather than built analytically, to match the simulated circuit bit for bit
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))
+    return Statevector.from_instruction(circuit)
 
 
 @ddt
 class TestQAOA(QiskitOptimizationTestCase):
     """Test QAOA with MaxCut."""
     @idata([
-        [W1, P1, M1, S1, False],
-        [W2, P2, M2, S2, False],
-        [W1, P1, M1, S1, True],
-        [W2, P2, M2, S2, True],
+        ['W1', P1, M1, S1, False],
+        ['W2', P2, M2, S2, False],
+        ['W1', P1, M1, S1, True],
+        ['W2', P2, M2, S2, True],
     ])
     @unpack
-    def test_qaoa(self, w, prob, m, solutions, convert_to_matrix_op):
+    def test_qaoa(self, graph, prob, m, solutions, convert_to_matrix_op):
         """ QAOA test """
+        w = _GRAPHS[graph]
         seed = 0
         aqua_globals.random_seed = seed
         self.log.debug('Testing %s-step QAOA with MaxCut on graph\n%s', prob, w)
 
-        backend = BasicAer.get_backend('statevector_simulator')
         optimizer = COBYLA()
-        qubit_op, offset = max_cut.get_operator(w)
-        qubit_op = qubit_op.to_opflow()
-        if convert_to_matrix_op:
-            qubit_op = qubit_op.to_matrix_op()
+        qubit_op, offset = _max_cut_operator(graph, convert_to_matrix_op)
 
         qaoa = QAOA(qubit_op, optimizer, prob, mixer=m)
-        quantum_instance = QuantumInstance(backend, seed_simulator=seed, seed_transpiler=seed)
+        quantum_instance = _quantum_instance(seed)
 
         result = qaoa.run(quantum_instance)
         x = sample_most_likely(result.eigenstate)
@@ -88,28 +157,24 @@ class TestQAOA(QiskitOptimizationTestCase):
         self.log.debug('maxcut objective:   %s', result.eigenvalue.real + offset)
         self.log.debug('solution:           %s', graph_solution)
         self.log.debug('solution objective: %s', max_cut.max_cut_value(x, w))
-        self.assertIn(''.join([str(int(i)) for i in graph_solution]), solutions)
+        self.assertIn(_bitstring(graph_solution), solutions)
 
     @idata([
-        [W1, P1, S1, False],
-        [W2, P2, S2, False],
-        [W1, P1, S1, True],
-        [W2, P2, S2, True],
+        ['W1', P1, S1, False],
+        ['W2', P2, S2, False],
+        ['W1', P1, S1, True],
+        ['W2', P2, S2, True],
     ])
     @unpack
-    def test_qaoa_qc_mixer(self, w, prob, solutions, convert_to_matrix_op):
+    def test_qaoa_qc_mixer(self, graph, prob, solutions, convert_to_matrix_op):
         """ QAOA test with a mixer as a parameterized circuit"""
         seed = 0
         aqua_globals.random_seed = seed
         self.log.debug('Testing %s-step QAOA with MaxCut on graph with '
-                       'a mixer as a parameterized circuit\n%s', prob, w)
+                       'a mixer as a parameterized circuit\n%s', prob, _GRAPHS[graph])
 
-        backend = BasicAer.get_backend('statevector_simulator')
         optimizer = COBYLA()
-        qubit_op, _ = max_cut.get_operator(w)
-        qubit_op = qubit_op.to_opflow()
-        if convert_to_matrix_op:
-            qubit_op = qubit_op.to_matrix_op()
+        qubit_op, _ = _max_cut_operator(graph, convert_to_matrix_op)
 
         num_qubits = qubit_op.num_qubits
         mixer = QuantumCircuit(num_qubits)
@@ -117,12 +182,12 @@ class TestQAOA(QiskitOptimizationTestCase):
         mixer.rx(theta, range(num_qubits))
 
         qaoa = QAOA(qubit_op, optimizer, prob, mixer=mixer)
-        quantum_instance = QuantumInstance(backend, seed_simulator=seed, seed_transpiler=seed)
+        quantum_instance = _quantum_instance(seed)
 
         result = qaoa.run(quantum_instance)
         x = sample_most_likely(result.eigenstate)
         graph_solution = max_cut.get_graph_solution(x)
-        self.assertIn(''.join([str(int(i)) for i in graph_solution]), solutions)
+        self.assertIn(_bitstring(graph_solution), solutions)
 
     def test_qaoa_qc_mixer_many_parameters(self):
         """ QAOA test with a mixer as a parameterized circuit with the num of parameters > 1. """
@@ -130,8 +195,7 @@ class TestQAOA(QiskitOptimizationTestCase):
         aqua_globals.random_seed = seed
 
         optimizer = COBYLA()
-        qubit_op, _ = max_cut.get_operator(W1)
-        qubit_op = qubit_op.to_opflow()
+        qubit_op, _ = _max_cut_operator('W1')
 
         num_qubits = qubit_op.num_qubits
         mixer = QuantumCircuit(num_qubits)
@@ -140,21 +204,19 @@ class TestQAOA(QiskitOptimizationTestCase):
             mixer.rx(theta, range(num_qubits))
 
         qaoa = QAOA(qubit_op, optimizer=optimizer, p=2, mixer=mixer)
-        backend = BasicAer.get_backend('statevector_simulator')
-        quantum_instance = QuantumInstance(backend, seed_simulator=seed, seed_transpiler=seed)
+        quantum_instance = _quantum_instance(seed)
         result = qaoa.run(quantum_instance)
         x = sample_most_likely(result.eigenstate)
         print(x)
         graph_solution = max_cut.get_graph_solution(x)
-        self.assertIn(''.join([str(int(i)) for i in graph_solution]), S1)
+        self.assertIn(_bitstring(graph_solution), S1)
 
     def test_qaoa_qc_mixer_no_parameters(self):
         """ QAOA test with a mixer as a parameterized circuit with zero parameters. """
         seed = 0
         aqua_globals.random_seed = seed
 
-        qubit_op, _ = max_cut.get_operator(W1)
-        qubit_op = qubit_op.to_opflow()
+        qubit_op, _ = _max_cut_operator('W1')
 
         num_qubits = qubit_op.num_qubits
         mixer = QuantumCircuit(num_qubits)
@@ -162,8 +224,7 @@ class TestQAOA(QiskitOptimizationTestCase):
         mixer.rx(np.pi/2, range(num_qubits))
 
         qaoa = QAOA(qubit_op, optimizer=COBYLA(), p=1, mixer=mixer)
-        backend = BasicAer.get_backend('statevector_simulator')
-        quantum_instance = QuantumInstance(backend, seed_simulator=seed, seed_transpiler=seed)
+        quantum_instance = _quantum_instance(seed)
         result = qaoa.run(quantum_instance)
         # we just assert that we get a result, it is not meaningful.
         self.assertIsNotNone(result.eigenstate)
@@ -172,34 +233,18 @@ class TestQAOA(QiskitOptimizationTestCase):
         """ QAOA change operator size test """
 
         aqua_globals.random_seed = 0
-        qubit_op, _ = max_cut.get_operator(
-            np.array([
-                [0, 1, 0, 1],
-                [1, 0, 1, 0],
-                [0, 1, 0, 1],
-                [1, 0, 1, 0]
-            ]))
-        qaoa = QAOA(qubit_op.to_opflow(), COBYLA(), 1)
-        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
-                                           seed_simulator=aqua_globals.random_seed,
-                                           seed_transpiler=aqua_globals.random_seed)
+        qubit_op, _ = _max_cut_operator('W1')
+        qaoa = QAOA(qubit_op, COBYLA(), 1)
+        quantum_instance = _quantum_instance(aqua_globals.random_seed)
         result = qaoa.run(quantum_instance)
         x = sample_most_likely(result.eigenstate)
         graph_solution = max_cut.get_graph_solution(x)
         with self.subTest(msg='QAOA 4x4'):
-            self.assertIn(''.join([str(int(i)) for i in graph_solution]), {'0101', '1010'})
+            self.assertIn(_bitstring(graph_solution), S1)
 
         try:
-            qubit_op, _ = max_cut.get_operator(
-                np.array([
-                    [0, 1, 0, 1, 0, 1],
-                    [1, 0, 1, 0, 1, 0],
-                    [0, 1, 0, 1, 0, 1],
-                    [1, 0, 1, 0, 1, 0],
-                    [0, 1, 0, 1, 0, 1],
-                    [1, 0, 1, 0, 1, 0],
-                ]))
-            qaoa.operator = qubit_op.to_opflow()
+            qubit_op, _ = _max_cut_operator('W3')
+            qaoa.operator = qubit_op
         except Exception as ex:  # pylint: disable=broad-except
             self.fail("Failed to change operator. Error: '{}'".format(str(ex)))
             return
@@ -208,7 +253,7 @@ class TestQAOA(QiskitOptimizationTestCase):
         x = sample_most_likely(result.eigenstate)
         graph_solution = max_cut.get_graph_solution(x)
         with self.subTest(msg='QAOA 6x6'):
-            self.assertIn(''.join([str(int(i)) for i in graph_solution]), {'010101', '101010'})
+            self.assertIn(_bitstring(graph_solution), S3)
 
     @idata([
         [W2, S2, None],
@@ -229,9 +274,7 @@ class TestQAOA(QiskitOptimizationTestCase):
             if eval_count == 1:
                 first_pt = list(parameters)
 
-        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
-                                           seed_simulator=aqua_globals.random_seed,
-                                           seed_transpiler=aqua_globals.random_seed)
+        quantum_instance = _quantum_instance(aqua_globals.random_seed)
         qaoa = QAOA(qubit_op, optimizer, initial_point=init_pt, callback=cb_callback,
                     quantum_instance=quantum_instance)
 
@@ -247,7 +290,7 @@ class TestQAOA(QiskitOptimizationTestCase):
                 self.assertListEqual(init_pt, first_pt)
 
         with self.subTest('Solution'):
-            self.assertIn(''.join([str(int(i)) for i in graph_solution]), solutions)
+            self.assertIn(_bitstring(graph_solution), solutions)
 
     @idata([
         [W2, None],
@@ -268,7 +311,7 @@ class TestQAOA(QiskitOptimizationTestCase):
         else:
             initial_state = Custom(num_qubits=4, state_vector=init_state)
 
-        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        quantum_instance = _quantum_instance()
         qaoa_zero_init_state = QAOA(qubit_op, optimizer, initial_point=init_pt,
                                     initial_state=Zero(qubit_op.num_qubits),
                                     quantum_instance=quantum_instance)
@@ -280,7 +323,11 @@ class TestQAOA(QiskitOptimizationTestCase):
 
         self.assertEqual(len(zero_circuits), len(custom_circuits))
 
-        backend = BasicAer.get_backend('statevector_simulator')
+        if initial_state is None:
+            statevector_original = _uniform_superposition(qubit_op.num_qubits)
+        else:
+            statevector_original = Statevector.from_instruction(initial_state.construct_circuit())
+
         for zero_circ, custom_circ in zip(zero_circuits, custom_circuits):
 
             z_length = len(zero_circ.data)
@@ -292,26 +339,14 @@ class TestQAOA(QiskitOptimizationTestCase):
             custom_init_qc = custom_circ.copy()
             custom_init_qc.data = custom_init_qc.data[0:c_length-z_length]
 
-            if initial_state is None:
-                original_init_qc = QuantumCircuit(qubit_op.num_qubits)
-                original_init_qc.h(range(qubit_op.num_qubits))
-            else:
-                original_init_qc = initial_state.construct_circuit()
-
-            job_init_state = execute(original_init_qc, backend)
-            job_qaoa_init_state = execute(custom_init_qc, backend)
-
-            statevector_original = job_init_state.result().get_statevector(original_init_qc)
-            statevector_custom = job_qaoa_init_state.result().get_statevector(custom_init_qc)
+            statevector_custom = Statevector.from_instruction(custom_init_qc)
 
-            self.assertEqual(statevector_original.tolist(), statevector_custom.tolist())
+            self.assertEqual(statevector_original.data.tolist(), statevector_custom.data.tolist())
 
     def test_qaoa_random_initial_point(self):
         """ QAOA random initial point """
         aqua_globals.random_seed = 10598
-        w = nx.adjacency_matrix(
-            nx.fast_gnp_random_graph(5, 0.5, seed=aqua_globals.random_seed)).toarray()
-        qubit_op, _ = max_cut.get_operator(w)
+        qubit_op, _ = max_cut.get_operator(W4)
         qaoa = QAOA(qubit_op, NELDER_MEAD(disp=True), 1)
 
         quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'),